@@ -100,6 +100,36 @@ def test_wordvectorizer_todataframe():
     assert df.shape == (7, 14)
 
 
+def test_wordvectorizer_lookup_words():
+    long_token = "x" * 20000
+    model = WordVectorizer().fit(test_text + [long_token, long_token])
+    assert long_token in model.token_label_dictionary_
+    tokens = sorted(model.token_label_dictionary_)
+    first, last = tokens[0], tokens[-1]
+    # Missing words sorting before the first token, after the last one and in between
+    words = ["", last, first + "~", first, last + "~", last]
+    vocab, matrix = model.lookup_words(words)
+    assert vocab == [last, first, last]
+    expected = model.representation_[
+        [model.token_label_dictionary_[word] for word in vocab], :
+    ]
+    assert (matrix != expected).nnz == 0
+
+    vocab, matrix = model.lookup_words([long_token, first + "\x00"])
+    assert vocab == [long_token]
+    expected = model.representation_[[model.token_label_dictionary_[long_token]], :]
+    assert (matrix != expected).nnz == 0
+
+    # Items that are not strings are simply not found
+    vocab, matrix = model.lookup_words([None, 1, first])
+    assert vocab == [first]
+    assert matrix.shape == (1, model.representation_.shape[1])
+
+    vocab, matrix = model.lookup_words([])
+    assert vocab == []
+    assert matrix.shape == (0, model.representation_.shape[1])
+
+
 def test_docvectorizer_todataframe():
     model = DocVectorizer().fit(test_text)
     df = model.to_DataFrame()
@@ -151,3 +181,94 @@ def test_wordvectorizer_basic(
     if vectorizer == "flat_1_5":
         assert result.shape == (7, 28)
     assert type(result) == scipy.sparse.csr.csr_matrix
+
+
+def test_docvectorizer_fit_unique():
+    model = DocVectorizer(fit_unique=True)
+    result = model.fit_transform(test_text)
+    assert result.shape == (5, 7)
+    # The first two documents are identical
+    assert (result[0] != result[1]).nnz == 0
+
+
+def test_wordvectorizer_memory(tmpdir):
+    result = WordVectorizer().fit_transform(test_text)
+    model = WordVectorizer(memory=str(tmpdir))
+    first = model.fit_transform(test_text)
+    second = model.fit_transform(test_text)
+    assert first.shape == result.shape
+    assert (first != second).nnz == 0
+    assert model.vocabulary_ == WordVectorizer().fit(test_text).vocabulary_
+
+
+def test_docvectorizer_bow_hash():
+    model = DocVectorizer(vectorizer="bow_hash")
+    result = model.fit_transform(test_text)
+    assert result.shape == (5, 2 ** 20)
+    assert model.vocabulary_ is None
+    assert (result != model.transform(test_text)).nnz == 0
+
+
+def test_docvectorizer_downcast():
+    model = DocVectorizer()
+    result = model.fit_transform(test_text)
+    assert result.dtype == np.float32
+    assert result.indices.dtype == np.int32
+    assert result.indptr.dtype == np.int32
+    assert model.transform(test_text).dtype == np.float32
+
+    # Downcasting builds a new matrix rather than rewriting the vectorizer's own
+    model = DocVectorizer(
+        tokenizer="sklearn",
+        info_weight_transformer=None,
+        remove_effects_transformer=None,
+        normalize=False,
+    ).fit(test_text)
+    assert model.representation_ is not model.vectorizer_._train_matrix
+    assert (model.representation_ != model.vectorizer_._train_matrix).nnz == 0
+
+
+def test_docvectorizer_chunk_size():
+    model = DocVectorizer(chunk_size=2)
+    result = model.fit_transform(test_text)
+    assert (result != model.transform(test_text)).nnz == 0
+    # Documents without len or slicing are chunked too
+    assert (result != model.transform(doc for doc in test_text)).nnz == 0
+    model.chunk_size = None
+    assert (result != model.transform(test_text)).nnz == 0
+
+
+def test_docvectorizer_tokenizer_kwds():
+    model = DocVectorizer(tokenizer="sklearn", tokenizer_kwds={"n_jobs": 2}).fit(test_text)
+    assert model.tokenizer_.n_jobs == 2
+
+    class WhitespaceTokenizer:
+        def fit_transform(self, X):
+            return tuple(tuple(doc.split()) for doc in X)
+
+        def transform(self, X):
+            return self.fit_transform(X)
+
+    model = DocVectorizer(tokenizer=WhitespaceTokenizer).fit(test_text)
+    assert model.representation_.shape[0] == len(test_text)
+
+
+def test_docvectorizer_normalize_keeps_vectorizer_counts():
+    model = DocVectorizer(
+        tokenizer="sklearn",
+        info_weight_transformer=None,
+        remove_effects_transformer=None,
+    ).fit(test_text)
+    assert model.vectorizer_._train_matrix is not model.representation_
+    assert model.vectorizer_._train_matrix.sum() > len(test_text)
+    # The empty document keeps a zero row
+    assert np.allclose(model.representation_.sum(axis=1).T, [1, 1, 0, 1, 1])
+
+
+def test_docvectorizer_memory(tmpdir):
+    model = DocVectorizer(memory=str(tmpdir))
+    first = model.fit_transform(test_text)
+    second = model.fit_transform(test_text)
+    assert first.shape == (5, 7)
+    assert (first != second).nnz == 0
+    assert (first != model.transform(test_text)).nnz == 0
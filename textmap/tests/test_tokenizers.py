@@ -131,3 +131,45 @@ def test_mwe_transformer(
     out_transform = mte.transform(tokens)
 
     assert out_fit_transform == out_transform
+
+
+@pytest.mark.parametrize("tokens_by", ["document", "sentence", "sentence_by_document"])
+@pytest.mark.parametrize("Tokenizer", [NLTKTokenizer, SKLearnTokenizer])
+def test_parallel_tokenizer(tokens_by, Tokenizer):
+    serial = Tokenizer(tokenize_by=tokens_by).fit_transform(test_text)
+    parallel = Tokenizer(tokenize_by=tokens_by, n_jobs=2, batch_size=2).fit_transform(
+        test_text
+    )
+    assert serial == parallel
+
+
+@pytest.mark.parametrize("Tokenizer", [NLTKTokenizer, SKLearnTokenizer, SpacyTokenizer])
+def test_tokenizer_transform(Tokenizer):
+    model = Tokenizer().fit(test_text)
+    fitted = model.tokenization_
+    assert model.transform(test_text) == fitted
+    assert model.transform(test_text[:2]) == fitted[:2]
+    assert model.tokenization_ is fitted
+
+
+class _Unpicklable:
+    def __reduce__(self):
+        raise AssertionError("The fitted tokenization_ was sent to a worker.")
+
+
+@pytest.mark.parametrize("tokens_by", ["document", "sentence"])
+@pytest.mark.parametrize("Tokenizer", [NLTKTokenizer, SKLearnTokenizer])
+def test_parallel_transform_does_not_send_tokenization(tokens_by, Tokenizer):
+    model = Tokenizer(tokenize_by=tokens_by, n_jobs=2, batch_size=2).fit(test_text)
+    expected = model.tokenization_
+    model.tokenization_ = _Unpicklable()
+    assert model.transform(test_text) == expected
+    assert model.transform(iter(test_text)) == expected
+
+
+def test_nltk_tokenizer_set_params_tokenize_by():
+    model = NLTKTokenizer(tokenize_by="sentence")
+    model.set_params(tokenize_by="document")
+    assert model.fit_transform(["I like dogs. They bark loudly."]) == (
+        ("i", "like", "dogs", ".", "they", "bark", "loudly", "."),
+    )
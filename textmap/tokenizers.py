@@ -1,31 +1,64 @@
-from .utilities import flatten
+from .utilities import flatten, flatten_list
 from warnings import warn
+from sys import intern
+from functools import partial
+from itertools import islice
 
 from sklearn.base import BaseEstimator, TransformerMixin
+from joblib import Parallel, delayed
 from nltk.tokenize import sent_tokenize, word_tokenize, TweetTokenizer
 import nltk.tokenize.api
 from sklearn.feature_extraction.text import CountVectorizer
 import numpy as np
 
-# Optional tokenization packages
-try:
-    import stanza
-except ImportError:
-    warn(
-        "The stanza library could not be imported StanzaTokenizer will not be available."
+# The optional tokenization packages (stanza and spaCy) are slow to import, so they are only
+# imported when a default pipeline for StanzaTokenizer or SpacyTokenizer is first built.
+
+
+def _tokenize_chunk(tokenize, chunk):
+    return [tokenize(doc) for doc in chunk]
+
+
+def _tokenize_text(tokenize, lower_case, text):
+    # Module level, and bound with functools.partial, so that parallel workers are sent only the
+    # nlp model and never the tokenizer itself along with its fitted tokenization_.
+    if lower_case:
+        return tuple([intern(token.lower()) for token in tokenize(text)])
+    return tuple(map(intern, tokenize(text)))
+
+
+def _tokenize_sentences(tokenize, lower_case, text):
+    return tuple(
+        [_tokenize_text(tokenize, lower_case, sent) for sent in sent_tokenize(text)]
     )
-try:
-    import spacy
-    from spacy.lang.en import English
-except ImportError:
-    warn(
-        "The SpaCy library could not be imported SpaCyTokenizer will not be available."
+
+
+def _intern_tokens(tokenization):
+    # Strings unpickled from worker processes are fresh copies; intern them again.
+    if isinstance(tokenization, str):
+        return intern(tokenization)
+    return tuple([_intern_tokens(item) for item in tokenization])
+
+
+def _map_documents(tokenize, X, n_jobs=1, batch_size=1000):
+    """
+    Apply tokenize to each document in X.  If n_jobs is not 1 the documents are split into
+    batches of batch_size documents which are tokenized in parallel via joblib.
+    """
+    if n_jobs == 1 or (hasattr(X, "__len__") and len(X) <= batch_size):
+        return [tokenize(doc) for doc in X]
+    documents = iter(X)
+    batches = iter(lambda: list(islice(documents, batch_size)), [])
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_tokenize_chunk)(tokenize, batch) for batch in batches
     )
+    return [_intern_tokens(doc) for doc in flatten_list(results)]
 
 
 class BaseTokenizer(BaseEstimator, TransformerMixin):
     """
-    Base class for all textmap tokenizers to inherit from.
+    Base class for all textmap tokenizers to inherit from.  Tokenizers intern the tokens they
+    produce so that repeated tokens share a single string object.
     
       Parameters
       ----------
@@ -39,9 +72,22 @@ class BaseTokenizer(BaseEstimator, TransformerMixin):
       lower_case = bool (default = True)
         Apply str.lower() to the tokens upon tokenization
 
+      n_jobs = int (default = 1)
+        The number of processes used to tokenize the documents; -1 uses all available cores.
+
+      batch_size = int (default = 1000)
+        The number of documents sent to a process at a time when n_jobs is not 1.
+
     """
 
-    def __init__(self, tokenize_by="document", nlp="default", lower_case=True):
+    def __init__(
+        self,
+        tokenize_by="document",
+        nlp="default",
+        lower_case=True,
+        n_jobs=1,
+        batch_size=1000,
+    ):
         try:
             assert tokenize_by in ["document", "sentence", "sentence_by_document"]
             self.tokenize_by = tokenize_by
@@ -55,6 +101,8 @@ class BaseTokenizer(BaseEstimator, TransformerMixin):
             self._flatten = flatten
         self.tokenization_ = None
         self.lower_case = lower_case
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
         self.nlp = nlp
 
     @property
@@ -97,6 +145,23 @@ class BaseTokenizer(BaseEstimator, TransformerMixin):
         self.fit(X, **fit_params)
         return self.tokenization_
 
+    def transform(self, X):
+        """
+        Tokenize the documents with the fitted model.  Tokenizers which only implement fit fall
+        back to fit_transform.
+
+        Parameters
+        ----------
+        X : collection
+            The collection of documents
+
+        Returns
+        -------
+        The list of tokenized documents or sentences
+        """
+
+        return self.fit_transform(X)
+
 
 ## A default NLTK Tokenizer model
 class _nltk_default_(nltk.tokenize.api.TokenizerI):
@@ -105,6 +170,17 @@ class _nltk_default_(nltk.tokenize.api.TokenizerI):
         return word_tokenize(X)
 
 
+## A default scikit-learn tokenizer model (a class rather than a lambda so that it pickles)
+class _sklearn_default_:
+    def __init__(self, lower_case=True):
+        cv = CountVectorizer(lowercase=lower_case)
+        self._word_tokenize = cv.build_tokenizer()
+        self._preprocess = cv.build_preprocessor()
+
+    def __call__(self, doc):
+        return self._word_tokenize(self._preprocess(doc))
+
+
 class NLTKTokenizer(BaseTokenizer):
     """
     Tokenizes via any NLTKTokenizer like class, using sent_tokenize and word_tokenize by default,
@@ -120,6 +196,12 @@ class NLTKTokenizer(BaseTokenizer):
 
       lower_case = bool (default = True)
         Apply str.lower() to the tokens upon tokenization
+
+      n_jobs = int (default = 1)
+        The number of processes used to tokenize the documents; -1 uses all available cores.
+
+      batch_size = int (default = 1000)
+        The number of documents sent to a process at a time when n_jobs is not 1.
     """
 
     @property
@@ -147,26 +229,53 @@ class NLTKTokenizer(BaseTokenizer):
         self
         """
 
-        if self.lower_case:
-            tokenize = lambda d: (w.lower() for w in self.nlp.tokenize(d))
-        else:
-            tokenize = lambda d: tuple(self.nlp.tokenize(d))
+        self.tokenization_ = self.transform(X)
+        return self
+
+    def transform(self, X):
+        """
+        Tokenize the documents without refitting; the nlp model is reused as is.
+
+        Parameters
+        ----------
+        X: collection
+            The list of documents
+
+        Returns
+        -------
+        The tuple of tokenized documents or sentences
+        """
 
         if self.tokenize_by in ["sentence", "sentence_by_document"]:
-            self.tokenization_ = self._flatten(
-                [
-                    tuple([tuple(tokenize(sent)) for sent in sent_tokenize(doc)])
-                    for doc in X
-                ]
+            # The text is already split into sentences, so skip word_tokenize's own (redundant)
+            # Punkt sentence splitting pass.
+            if isinstance(self.nlp, _nltk_default_):
+                tokenize = partial(word_tokenize, preserve_line=True)
+            else:
+                tokenize = self.nlp.tokenize
+            tokenization = self._flatten(
+                _map_documents(
+                    partial(_tokenize_sentences, tokenize, self.lower_case),
+                    X,
+                    self.n_jobs,
+                    self.batch_size,
+                )
             )
 
         elif self.tokenize_by == "document":
-            self.tokenization_ = tuple([tuple(tokenize(doc)) for doc in X])
+            tokenization = tuple(
+                _map_documents(
+                    partial(_tokenize_text, self.nlp.tokenize, self.lower_case),
+                    X,
+                    self.n_jobs,
+                    self.batch_size,
+                )
+            )
         else:
             raise ValueError(
                 'The tokenize_by parameter must be "document",  "sentence", or "sentence_by_document".'
             )
-        return self
+        return tokenization
 
 
 class NLTKTweetTokenizer(NLTKTokenizer):
@@ -184,12 +293,30 @@ class NLTKTweetTokenizer(NLTKTokenizer):
 
       lower_case = bool (default = True)
         Apply str.lower() to the tokens upon tokenization
+
+      n_jobs = int (default = 1)
+        The number of processes used to tokenize the documents; -1 uses all available cores.
+
+      batch_size = int (default = 1000)
+        The number of documents sent to a process at a time when n_jobs is not 1.
     """
 
-    def __init__(self, tokenize_by="document", nlp="default", lower_case=True):
+    def __init__(
+        self,
+        tokenize_by="document",
+        nlp="default",
+        lower_case=True,
+        n_jobs=1,
+        batch_size=1000,
+    ):
         self.nlp = nlp
         NLTKTokenizer.__init__(
-            self, tokenize_by=tokenize_by, nlp=self.nlp, lower_case=lower_case
+            self,
+            tokenize_by=tokenize_by,
+            nlp=self.nlp,
+            lower_case=lower_case,
+            n_jobs=n_jobs,
+            batch_size=batch_size,
         )
 
     @property
@@ -226,6 +353,12 @@ class SKLearnTokenizer(BaseTokenizer):
 
     lower_case = bool (default = True)
         Apply str.lower() to the tokens upon tokenization
+
+    n_jobs = int (default = 1)
+        The number of processes used to tokenize the documents; -1 uses all available cores.
+
+    batch_size = int (default = 1000)
+        The number of documents sent to a process at a time when n_jobs is not 1.
     """
 
     @property
@@ -235,10 +368,7 @@ class SKLearnTokenizer(BaseTokenizer):
     @nlp.setter
     def nlp(self, model):
         if model == "default":
-            cv = CountVectorizer(lowercase=self.lower_case)
-            sk_word_tokenize = cv.build_tokenizer()
-            sk_preprocesser = cv.build_preprocessor()
-            self._nlp = lambda doc: sk_word_tokenize(sk_preprocesser(doc))
+            self._nlp = _sklearn_default_(lower_case=self.lower_case)
         else:
             self._nlp = model
 
@@ -255,23 +385,50 @@ class SKLearnTokenizer(BaseTokenizer):
         self
         """
 
+        self.tokenization_ = self.transform(X)
+        return self
+
+    def transform(self, X):
+        """
+        Tokenize the documents without refitting; the nlp model is reused as is.
+
+        Parameters
+        ----------
+        X: collection
+            The list of documents
+
+        Returns
+        -------
+        The tuple of tokenized documents or sentences
+        """
+
+        # The sklearn model does its own lower casing.
         if self.tokenize_by in ["sentence", "sentence_by_document"]:
-            self.tokenization_ = self._flatten(
-                [
-                    tuple([tuple(self.nlp(sent)) for sent in sent_tokenize(doc)])
-                    for doc in X
-                ]
+            tokenization = self._flatten(
+                _map_documents(
+                    partial(_tokenize_sentences, self.nlp, False),
+                    X,
+                    self.n_jobs,
+                    self.batch_size,
+                )
             )
 
         elif self.tokenize_by == "document":
-            self.tokenization_ = tuple([tuple(self.nlp(doc)) for doc in X])
+            tokenization = tuple(
+                _map_documents(
+                    partial(_tokenize_text, self.nlp, False),
+                    X,
+                    self.n_jobs,
+                    self.batch_size,
+                )
+            )
 
         else:
             raise ValueError(
                 'The tokenize_by parameter must be "document",  "sentence", or "sentence_by_document".'
             )
 
-        return self
+        return tokenization
 
 
 class StanzaTokenizer(BaseTokenizer):
@@ -288,6 +445,12 @@ class StanzaTokenizer(BaseTokenizer):
 
     lower_case = bool (default = True)
         Apply str.lower() to the tokens upon tokenization
+
+    n_jobs = int (default = 1)
+        Not used; stanza pipelines tokenize documents serially.
+
+    batch_size = int (default = 1000)
+        Not used; stanza pipelines tokenize documents serially.
     """
 
     @property
@@ -298,6 +461,8 @@ class StanzaTokenizer(BaseTokenizer):
     def nlp(self, model):
         if model == "default":
             # A default Stanza NLP pipeline
+            import stanza
+
             stanza.download(lang="en", processors="tokenize")
             if self.tokenize_by in ["sentence", "sentence_by_document"]:
                 BASIC_STANZA_PIPELINE = stanza.Pipeline(processors="tokenize")
@@ -337,13 +502,30 @@ class StanzaTokenizer(BaseTokenizer):
         self
         """
 
+        self.tokenization_ = self.transform(X)
+        return self
+
+    def transform(self, X):
+        """
+        Tokenize the documents without refitting; the nlp model is reused as is.
+
+        Parameters
+        ----------
+        X: collection
+            The list of documents
+
+        Returns
+        -------
+        The tuple of tokenized documents or sentences
+        """
+
         if self.lower_case:
-            token_text = lambda t: (t.text).lower()
+            token_text = lambda t: intern((t.text).lower())
         else:
-            token_text = lambda t: t.text
+            token_text = lambda t: intern(t.text)
 
         if self.tokenize_by in ["sentence", "sentence_by_document"]:
-            self.tokenization_ = self._flatten(
+            tokenization = self._flatten(
                 [
                     tuple(
                         [
@@ -355,7 +537,7 @@ class StanzaTokenizer(BaseTokenizer):
                 ]
             )
         elif self.tokenize_by == "document":
-            self.tokenization_ = tuple(
+            tokenization = tuple(
                 [
                     tuple([token_text(token) for token in self.nlp(doc).iter_tokens()])
                     for doc in X
@@ -365,7 +547,7 @@ class StanzaTokenizer(BaseTokenizer):
             raise ValueError(
                 'The tokenize_by parameter must be "document",  "sentence", or "sentence_by_document".'
             )
-        return self
+        return tokenization
 
 
 class SpacyTokenizer(BaseTokenizer):
@@ -382,6 +564,12 @@ class SpacyTokenizer(BaseTokenizer):
 
     lower_case = bool (default = True)
         Tokenizes as the token.text (if False) or token.lower (if True)
+
+    n_jobs = int (default = 1)
+        The number of processes passed to nlp.pipe; -1 uses all available cores.
+
+    batch_size = int (default = 1000)
+        The number of documents buffered by nlp.pipe at a time.
     """
 
     @property
@@ -392,7 +580,9 @@ class SpacyTokenizer(BaseTokenizer):
     def nlp(self, model):
         if model == "default":
             # A default spaCy NLP pipeline
-            BASIC_SPACY_PIPELINE = spacy.lang.en.English()
+            from spacy.lang.en import English
+
+            BASIC_SPACY_PIPELINE = English()
             if self.tokenize_by in ["sentence", "sentence_by_document"]:
                 BASIC_SPACY_PIPELINE.add_pipe(
                     BASIC_SPACY_PIPELINE.create_pipe("sentencizer"), first=True
@@ -430,6 +620,23 @@ class SpacyTokenizer(BaseTokenizer):
         self
         """
 
+        self.tokenization_ = self.transform(X)
+        return self
+
+    def transform(self, X):
+        """
+        Tokenize the documents without refitting; the nlp model is reused as is.
+
+        Parameters
+        ----------
+        X: collection
+            The list of documents
+
+        Returns
+        -------
+        The tuple of tokenized documents or sentences
+        """
+
         # We need to handle data types propers, Spacy does not like numpy.str_ types for example.
         if type(X[0]) != str:
             type_cast = lambda X : list(map(str, X))
@@ -438,13 +645,13 @@ class SpacyTokenizer(BaseTokenizer):
 
         # A function for adjusting the case
         if self.lower_case:
-            token_text = lambda t: t.lower_
+            token_text = lambda t: intern(t.lower_)
         else:
-            token_text = lambda t: t.text
+            token_text = lambda t: intern(t.text)
 
         # Tokenize the text
         if self.tokenize_by in ["sentence", "sentence_by_document"]:
-            self.tokenization_ = self._flatten(
+            tokenization = self._flatten(
                 [
                     tuple(
                         [
@@ -452,15 +659,19 @@ class SpacyTokenizer(BaseTokenizer):
                             for sent in doc.sents
                         ]
                     )
-                    for doc in self.nlp.pipe(type_cast(X))
+                    for doc in self.nlp.pipe(
+                        type_cast(X), n_process=self.n_jobs, batch_size=self.batch_size
+                    )
                 ]
             )
 
         elif self.tokenize_by == "document":
-            self.tokenization_ = tuple(
+            tokenization = tuple(
                 [
                     tuple([token_text(token) for token in doc])
-                    for doc in self.nlp.pipe(type_cast(X))
+                    for doc in self.nlp.pipe(
+                        type_cast(X), n_process=self.n_jobs, batch_size=self.batch_size
+                    )
                 ]
             )
         else:
@@ -468,4 +679,4 @@ class SpacyTokenizer(BaseTokenizer):
                 'The tokenize_by parameter must be "document",  "sentence", or "sentence_by_document".'
             )
 
-        return self
+        return tokenization
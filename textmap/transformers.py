@@ -7,6 +7,7 @@ import scipy.sparse
 import enstop
 from nltk.collocations import BigramCollocationFinder
 from nltk.metrics import BigramAssocMeasures
+from nltk.probability import FreqDist
 from nltk.tokenize import MWETokenizer
 import re
 from warnings import warn
@@ -15,7 +16,7 @@ from warnings import warn
 EPS = 1e-11
 
 
-@numba.njit()
+@numba.njit(cache=True)
 def fuzz01(val):
     if val >= 1.0:
         return 1.0 - EPS
@@ -24,7 +25,7 @@ def fuzz01(val):
     return val
 
 
-@numba.njit()
+@numba.njit(cache=True)
 def idf_avg_weight(row, col, val, frequencies_i, frequencies_j, token_counts):
     """
 
@@ -60,7 +61,7 @@ def idf_avg_weight(row, col, val, frequencies_i, frequencies_j, token_counts):
     return val
 
 
-@numba.njit()
+@numba.njit(cache=True)
 def avg_idf_weight(row, col, val, frequencies_i, frequencies_j, token_counts):
     """
 
@@ -92,7 +93,7 @@ def avg_idf_weight(row, col, val, frequencies_i, frequencies_j, token_counts):
     return val
 
 
-# @numba.njit()
+# @numba.njit(cache=True)
 def column_kl_divergence_weight(
     row, col, val, frequencies_i, frequencies_j, token_counts
 ):
@@ -140,7 +141,7 @@ def column_kl_divergence_weight(
     return val
 
 
-# @numba.njit()
+# @numba.njit(cache=True)
 def bernoulli_kl_divergence_weight(
     row, col, val, frequencies_i, frequencies_j, token_counts
 ):
@@ -384,7 +385,7 @@ class InformationWeightTransformer(BaseEstimator, TransformerMixin):
         return result
 
 
-@numba.njit()
+@numba.njit(cache=True)
 def numba_multinomial_em_sparse(
     indptr,
     inds,
@@ -640,6 +641,63 @@ class RemoveEffectsTransformer(BaseEstimator, TransformerMixin):
         return result
 
 
+def token_and_bigram_counts(ids, indptr, n_ids):
+    """
+    Count the tokens and the adjacent token pairs within each row of a CSR style (ids, indptr)
+    pair.  Bigrams are encoded as first_id * n_ids + second_id.
+
+    Returns
+    -------
+    token_counts, bigram_keys, bigram_counts
+    """
+    token_counts = np.bincount(ids, minlength=n_ids)
+    if ids.shape[0] < 2:
+        return token_counts, np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+    pair_keys = ids[:-1] * n_ids + ids[1:]
+    # Pairs that straddle the boundary between two rows are not bigrams.
+    valid = np.ones(pair_keys.shape[0], dtype=np.bool_)
+    row_starts = indptr[1:-1]
+    row_starts = row_starts[(row_starts > 0) & (row_starts < ids.shape[0])]
+    valid[row_starts - 1] = False
+    bigram_keys, bigram_counts = np.unique(pair_keys[valid], return_counts=True)
+    return token_counts, bigram_keys, bigram_counts
+
+
+@numba.njit(cache=True)
+def contract_bigrams(ids, indptr, bigram_keys, bigram_ids, n_ids):
+    """
+    Scan each row of a CSR style (ids, indptr) pair left to right, replacing any adjacent pair
+    of tokens whose key (first_id * n_ids + second_id) is in the sorted array bigram_keys with
+    the corresponding entry of bigram_ids.  This matches nltk's MWETokenizer on bigrams.
+
+    Returns
+    -------
+    new_ids, new_indptr
+    """
+    new_ids = np.empty_like(ids)
+    new_indptr = np.empty_like(indptr)
+    new_indptr[0] = 0
+    position = 0
+    for row in range(indptr.shape[0] - 1):
+        i = indptr[row]
+        end = indptr[row + 1]
+        while i < end:
+            if i + 1 < end:
+                key = ids[i] * n_ids + ids[i + 1]
+                k = np.searchsorted(bigram_keys, key)
+                if k < bigram_keys.shape[0] and bigram_keys[k] == key:
+                    new_ids[position] = bigram_ids[k]
+                    position += 1
+                    i += 2
+                    continue
+            new_ids[position] = ids[i]
+            position += 1
+            i += 1
+        new_indptr[row + 1] = position
+    return new_ids[:position], new_indptr
+
+
 class MultiTokenExpressionTransformer(BaseEstimator, TransformerMixin):
     """
     The transformer takes sequences of tokens and contracts bigrams meeting certain criteria set out by the parameters.
@@ -668,7 +726,7 @@ class MultiTokenExpressionTransformer(BaseEstimator, TransformerMixin):
     ignored_tokens = set (default = None)
         Only contracts bigrams where both tokens are not in the ignored_tokens
 
-    excluded_token_regex = str (default = r\"\W+\")
+    excluded_token_regex = str or compiled regular expression (default = r\"\W+\")
         Do not contract bigrams when either of the tokens fully matches the regular expression via re.fullmatch
 
     """
@@ -705,19 +763,49 @@ class MultiTokenExpressionTransformer(BaseEstimator, TransformerMixin):
         that score higher on the collocation_function than the min_collocation_score (and satisfy other
         criteria set out by the optional parameters).
         """
+        # utilities imports this module, so we can't import it at the top level
+        from .utilities import _sentences_to_csr
+
         self.tokenization_ = X
         n_tokens = sum([len(x) for x in X])
+
+        # Work with integer token ids; bigrams are counted and contracted over the id arrays.
+        token_dictionary = {}
+        ids, indptr = _sentences_to_csr(X, token_dictionary)
+        ids = ids.astype(np.int64)
+        vocabulary = list(token_dictionary.keys())
+        contracted = False
+
+        # Compile once rather than looking the pattern up for every word we filter.
+        if not self.excluded_token_regex == None:
+            excluded_regex = re.compile(self.excluded_token_regex)
+
         for i in range(self.max_iterations):
-            bigramer = BigramCollocationFinder.from_documents(self.tokenization_)
+            n_ids = len(vocabulary)
+            token_counts, bigram_keys, bigram_counts = token_and_bigram_counts(
+                ids, indptr, n_ids
+            )
+            word_fd = FreqDist(
+                {
+                    vocabulary[token]: count
+                    for token, count in enumerate(token_counts.tolist())
+                    if count > 0
+                }
+            )
+            bigram_fd = FreqDist(
+                {
+                    (vocabulary[key // n_ids], vocabulary[key % n_ids]): count
+                    for key, count in zip(bigram_keys.tolist(), bigram_counts.tolist())
+                }
+            )
+            bigramer = BigramCollocationFinder(word_fd, bigram_fd)
 
             if not self.ignored_tokens == None:
                 ignore_fn = lambda w: w in self.ignored_tokens
                 bigramer.apply_word_filter(ignore_fn)
 
             if not self.excluded_token_regex == None:
-                exclude_fn = (
-                    lambda w: re.fullmatch(self.excluded_token_regex, w) is not None
-                )
+                exclude_fn = lambda w: excluded_regex.fullmatch(w) is not None
                 bigramer.apply_word_filter(exclude_fn)
 
             if not self.min_token_occurrences == None:
@@ -750,9 +838,31 @@ class MultiTokenExpressionTransformer(BaseEstimator, TransformerMixin):
 
             self.mtes_.append(new_grams)
 
-            contracter = MWETokenizer(new_grams)
+            # Contract with the same "_" separator as MWETokenizer uses in transform.
+            contracted_keys = np.empty(len(new_grams), dtype=np.int64)
+            contracted_ids = np.empty(len(new_grams), dtype=np.int64)
+            for k, (first, second) in enumerate(new_grams):
+                contracted_keys[k] = (
+                    token_dictionary[first] * n_ids + token_dictionary[second]
+                )
+                contracted_ids[k] = token_dictionary.setdefault(
+                    first + "_" + second, len(token_dictionary)
+                )
+                if contracted_ids[k] == len(vocabulary):
+                    vocabulary.append(first + "_" + second)
+            order = np.argsort(contracted_keys)
+            ids, indptr = contract_bigrams(
+                ids, indptr, contracted_keys[order], contracted_ids[order], n_ids
+            )
+            contracted = True
+
+        if contracted:
+            vocabulary = np.array(vocabulary, dtype=object)
             self.tokenization_ = tuple(
-                [tuple(contracter.tokenize(doc)) for doc in self.tokenization_]
+                [
+                    tuple(vocabulary[ids[indptr[j] : indptr[j + 1]]])
+                    for j in range(indptr.shape[0] - 1)
+                ]
             )
 
         return self
@@ -7,7 +7,7 @@ from .transformers import (
     RemoveEffectsTransformer,
 )
 from vectorizers import TokenCooccurrenceVectorizer
-from scipy.sparse import hstack
+import scipy.sparse
 from sklearn.preprocessing import normalize
 
 
@@ -73,6 +73,255 @@ def flatten_list(list_of_seq):
         return list_of_seq
 
 
+def _transform_sentences_by_document(transformer, sentences_by_document):
+    """
+    Apply a sentence level transformer, such as a token contractor, to every sentence of every
+    document in one call on the chained sentences, then regroup the results by document.  This is
+    equivalent to transforming each document separately without paying the per call set up cost
+    once per document.
+
+    Parameters
+    ----------
+    transformer: an object with a transform method mapping a sequence of sentences to a
+        sequence of sentences of the same length
+    sentences_by_document: sequence of sequences of token sequences
+
+    Returns
+    -------
+    A list with one tuple of transformed sentences per document.
+    """
+    lengths = [len(doc) for doc in sentences_by_document]
+    sentences = transformer.transform(
+        tuple(itertools.chain.from_iterable(sentences_by_document))
+    )
+    ends = itertools.accumulate(lengths)
+    return [tuple(sentences[end - length : end]) for length, end in zip(lengths, ends)]
+
+
+def _sentences_to_csr(sequences, token_dictionary=None):
+    """
+    Convert a sequence of token sequences into a flat array of integer token ids along with an
+    indptr array marking where each sequence starts and ends, as in a CSR matrix.
+
+    Parameters
+    ----------
+    sequences: sequence of token sequences
+    token_dictionary: dict (optional, default=None)
+        A dictionary mapping tokens to ids.  Unseen tokens are added to it with the next free id.
+
+    Returns
+    -------
+    (ids, indptr) such that ids[indptr[i]:indptr[i + 1]] are the token ids of sequences[i].
+    """
+    if token_dictionary is None:
+        token_dictionary = {}
+    n_sequences = len(sequences)
+    indptr = np.zeros(n_sequences + 1, dtype=np.int64)
+    np.cumsum(
+        np.fromiter((len(seq) for seq in sequences), dtype=np.int64, count=n_sequences),
+        out=indptr[1:],
+    )
+    ids = np.fromiter(
+        (
+            token_dictionary.setdefault(token, len(token_dictionary))
+            for token in itertools.chain.from_iterable(sequences)
+        ),
+        dtype=np.int32,
+        count=indptr[-1],
+    )
+    return ids, indptr
+
+
+def _dedupe_sequences(sequences, return_inverse=False):
+    """
+    Remove duplicate sequences, keeping them in order of first occurrence.  The work is done by
+    dictionary construction over tuples of tokens, which runs at C speed.
+
+    Parameters
+    ----------
+    sequences: sequence of token sequences
+    return_inverse: bool (default=False)
+        Also return the indices that reconstruct the original sequences from the unique ones.
+
+    Returns
+    -------
+    A tuple of the unique sequences in order of first occurrence, and optionally an array inverse
+    such that unique_sequences[inverse[i]] == sequences[i].
+    """
+    if not return_inverse:
+        return tuple(dict.fromkeys(map(tuple, sequences)))
+
+    lookup = {}
+    inverse = np.fromiter(
+        (lookup.setdefault(seq, len(lookup)) for seq in map(tuple, sequences)),
+        dtype=np.int64,
+        count=len(sequences),
+    )
+    return tuple(lookup), inverse
+
+
+def _hstack_csr(matrices):
+    """
+    Horizontally stack CSR matrices by stitching their data, indices and indptr arrays together
+    directly.  Unlike scipy.sparse.hstack this never converts through COO, so no extra copies of
+    the data are held while stacking.
+
+    Parameters
+    ----------
+    matrices: list of sparse matrices with the same number of rows
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+    """
+    matrices = [matrix.tocsr() for matrix in matrices]
+    n_rows = matrices[0].shape[0]
+    if any(matrix.shape[0] != n_rows for matrix in matrices):
+        raise ValueError(
+            f"Matrices must have the same number of rows to be stacked horizontally; "
+            f"got {[matrix.shape[0] for matrix in matrices]}."
+        )
+    n_cols = sum(matrix.shape[1] for matrix in matrices)
+
+    indptr = np.zeros(n_rows + 1, dtype=np.int64)
+    for matrix in matrices:
+        indptr += matrix.indptr
+    nnz = indptr[-1]
+    index_dtype = np.int32 if max(nnz, n_cols) < 2 ** 31 else np.int64
+    indptr = indptr.astype(index_dtype)
+
+    data = np.empty(nnz, dtype=np.result_type(*[matrix.dtype for matrix in matrices]))
+    indices = np.empty(nnz, dtype=index_dtype)
+    # The next free position in each row of the result
+    row_position = indptr[:-1].astype(np.int64)
+    column_offset = 0
+    for matrix in matrices:
+        row_nnz = np.diff(matrix.indptr)
+        destination = np.repeat(row_position - matrix.indptr[:-1], row_nnz)
+        destination += np.arange(matrix.nnz)
+        data[destination] = matrix.data[: matrix.nnz]
+        indices[destination] = (
+            matrix.indices[: matrix.nnz].astype(index_dtype) + column_offset
+        )
+        row_position += row_nnz
+        column_offset += matrix.shape[1]
+
+    return scipy.sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_cols))
+
+
+def _vstack_csr(matrices):
+    """
+    Vertically stack CSR matrices by concatenating their data and indices arrays and offsetting
+    their indptr arrays, which keeps the result in CSR format without a round trip through COO.
+
+    Parameters
+    ----------
+    matrices: list of sparse matrices with the same number of columns
+
+    Returns
+    -------
+    scipy.sparse.csr_matrix
+    """
+    matrices = [matrix.tocsr() for matrix in matrices]
+    n_cols = matrices[0].shape[1]
+    if any(matrix.shape[1] != n_cols for matrix in matrices):
+        raise ValueError(
+            f"Matrices must have the same number of columns to be stacked vertically; "
+            f"got {[matrix.shape[1] for matrix in matrices]}."
+        )
+    n_rows = sum(matrix.shape[0] for matrix in matrices)
+    nnz = sum(matrix.nnz for matrix in matrices)
+    index_dtype = np.int32 if max(nnz, n_cols) < 2 ** 31 else np.int64
+
+    data = np.concatenate([matrix.data[: matrix.nnz] for matrix in matrices])
+    indices = np.concatenate(
+        [matrix.indices[: matrix.nnz].astype(index_dtype) for matrix in matrices]
+    )
+    indptr = np.zeros(n_rows + 1, dtype=index_dtype)
+    row_offset = 0
+    nnz_offset = 0
+    for matrix in matrices:
+        n_matrix_rows = matrix.shape[0]
+        indptr[row_offset + 1 : row_offset + n_matrix_rows + 1] = (
+            matrix.indptr[1:] + nnz_offset
+        )
+        row_offset += n_matrix_rows
+        nnz_offset += matrix.nnz
+
+    return scipy.sparse.csr_matrix((data, indices, indptr), shape=(n_rows, n_cols))
+
+
+def _downcast_csr(matrix):
+    """
+    Store a CSR matrix with int32 indices and indptr and float32 data, halving the memory
+    traffic of the steps that follow.  Matrices too large for int32 indexing are left as is.
+
+    Parameters
+    ----------
+    matrix: scipy.sparse.csr_matrix
+
+    Returns
+    -------
+    A new matrix, downcast where possible; the input matrix is never modified since fitted
+    stages may keep a reference to it.
+    """
+    if not (scipy.sparse.issparse(matrix) and matrix.format == "csr"):
+        return matrix
+    if matrix.nnz >= 2 ** 31 or max(matrix.shape) >= 2 ** 31:
+        return matrix
+    return scipy.sparse.csr_matrix(
+        (
+            matrix.data.astype(np.float32, copy=False),
+            matrix.indices.astype(np.int32, copy=False),
+            matrix.indptr.astype(np.int32, copy=False),
+        ),
+        shape=matrix.shape,
+    )
+
+
+def _l1_normalize_rows(matrix, copy=True):
+    """
+    L1 normalize the rows of a CSR matrix by rescaling its data array.  Rows that sum to zero are
+    left as is.
+
+    Parameters
+    ----------
+    matrix: scipy.sparse.csr_matrix
+    copy: bool (default=True)
+        Normalize a copy of the matrix.  Pass False to rescale in place, avoiding the extra copy
+        made by sklearn.preprocessing.normalize, but only when no fitted stage holds a reference
+        to the matrix.
+
+    Returns
+    -------
+    The row normalized matrix.
+    """
+    matrix = matrix.tocsr()
+    if copy:
+        matrix = matrix.copy()
+    if not np.issubdtype(matrix.data.dtype, np.floating):
+        matrix.data = matrix.data.astype(np.float64)
+    row_nnz = np.diff(matrix.indptr)
+    row_sums = np.zeros(matrix.shape[0], dtype=matrix.data.dtype)
+    # np.add.reduceat misbehaves on empty rows so only reduce over rows with entries.
+    non_empty = row_nnz > 0
+    row_sums[non_empty] = np.add.reduceat(
+        np.abs(matrix.data[: matrix.nnz]), matrix.indptr[:-1][non_empty]
+    )
+    row_sums[row_sums == 0] = 1.0
+    matrix.data[: matrix.nnz] /= np.repeat(row_sums, row_nnz)
+    return matrix
+
+
+def _fit_transform_one(transformer, X):
+    """
+    Fit a pipeline stage and return its output along with the fitted stage.  Returning the
+    stage lets joblib.Memory cache the fitted state alongside the result.
+    """
+    result = transformer.fit_transform(X)
+    return result, transformer
+
+
 def create_processing_pipeline_stage(class_to_create, class_dict, kwds, class_type):
     if class_to_create is None:
         return None
@@ -162,10 +411,8 @@ class MultiTokenCooccurrenceVectorizer(BaseEstimator, TransformerMixin):
             f"remove effects transformer",
         )
 
-        # TODO: Check to make sure all matrices have the same number of rows and throw
-        # informative error.
-
         self.column_label_dictionary_ = {}
+        representations = []
 
         for i, vectorizer in enumerate(self.vectorizer_list):
             vectorizer_ = create_processing_pipeline_stage(
@@ -190,9 +437,7 @@ class MultiTokenCooccurrenceVectorizer(BaseEstimator, TransformerMixin):
                 self.token_label_dictionary_ = vectorizer_.column_label_dictionary_
                 self.token_index_dictionary_ = vectorizer_.column_index_dictionary_
                 self.vocabulary_size_ = len(vectorizer_.column_label_dictionary_)
-                self.representation_ = token_cooccurence
-            else:
-                self.representation_ = hstack([self.representation_, token_cooccurence])
+            representations.append(token_cooccurence)
 
             column_label_dictionary_ = {
                 (item[0] + i * self.vocabulary_size_): self.vectorizer_names_list_[i]
@@ -205,7 +450,8 @@ class MultiTokenCooccurrenceVectorizer(BaseEstimator, TransformerMixin):
         self.column_index_dictionary_ = {
             item[1]: item[0] for item in self.column_label_dictionary_.items()
         }
-        self.representation_ = self.representation_.tocsr()
+        # _hstack_csr raises an informative error if the views have differing numbers of rows.
+        self.representation_ = _hstack_csr(representations)
         return self
 
     def fit_transform(self, X, y=None, **fit_params):
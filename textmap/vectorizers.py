@@ -8,6 +8,12 @@ from .utilities import (
     _REMOVE_EFFECT_TRANSFORMERS,
     _COOCCURRENCE_VECTORIZERS,
     initialize_kwds,
+    _dedupe_sequences,
+    _downcast_csr,
+    _transform_sentences_by_document,
+    _vstack_csr,
+    _fit_transform_one,
+    _l1_normalize_rows,
 )
 from .tokenizers import (
     NLTKTokenizer,
@@ -17,12 +23,20 @@ from .tokenizers import (
     SKLearnTokenizer,
 )
 
+import re
+from itertools import islice
 import scipy.sparse as sparse
 import numpy as np
-from sklearn.preprocessing import normalize
 import pandas as pd
-from sklearn.utils.validation import check_X_y, check_array, check_is_fitted
+from warnings import warn
+from sklearn.utils.validation import (
+    check_X_y,
+    check_array,
+    check_is_fitted,
+    check_memory,
+)
 from sklearn.decomposition import TruncatedSVD
+from sklearn.feature_extraction.text import HashingVectorizer
 
 # TruncatedSVD or a variety of other algorithms should also work.
 # TODO: should we wrap PLSA in a try and fall back on TruncatedSVD to remove the hard dependency?
@@ -57,19 +71,43 @@ _CONTRACTORS = {
     },
 }
 
+# Compiled once and shared by every vectorizer that excludes non-word tokens.
+_EXCLUDED_TOKEN_RE = re.compile(r"\W+")
+
+
+def _identity_analyzer(tokens):
+    # Our documents arrive already tokenized.
+    return tokens
+
+
 _TOKEN_VECTORIZERS = {
     "bow": {"class": NgramVectorizer, "kwds": {"min_frequency": 1e-5}, },
+    # A single pass bag of words with no vocabulary; columns are token hashes.
+    "bow_hash": {
+        "class": HashingVectorizer,
+        "kwds": {
+            "n_features": 2 ** 20,
+            "alternate_sign": False,
+            "norm": None,
+            "analyzer": _identity_analyzer,
+            "token_pattern": None,
+        },
+    },
     "bigram": {
         "class": NgramVectorizer,
         "kwds": {"ngram_size": 2, "min_frequency": 1e-5},
     },
     "bow_words": {
         "class": NgramVectorizer,
-        "kwds": {"min_frequency": 1e-5, "excluded_token_regex": "\W+"},
+        "kwds": {"min_frequency": 1e-5, "excluded_token_regex": _EXCLUDED_TOKEN_RE},
     },
     "bigram_words": {
         "class": NgramVectorizer,
-        "kwds": {"ngram_size": 2, "min_frequency": 1e-5, "excluded_token_regex": "\W+"},
+        "kwds": {
+            "ngram_size": 2,
+            "min_frequency": 1e-5,
+            "excluded_token_regex": _EXCLUDED_TOKEN_RE,
+        },
     },
 }
 
@@ -127,6 +165,13 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
     dedupe_sentences: bool (default=True)
         Should you remove duplicate sentences.  Repeated sentences (such as signature blocks) often
         don't provide any extra linguistic information about word usage.
+    n_jobs: int (default=1)
+        The number of processes used by a built in tokenizer; -1 uses all available cores.
+    batch_size: int (default=1000)
+        The number of documents handed to each tokenizer process at a time.
+    memory: None, str or joblib.Memory (default=None)
+        Used to cache the fitted tokenizer, token contractor and vectorizer.  If a string is given
+        it is the path to the caching directory.  By default no caching is performed.
     """
 
     def __init__(
@@ -139,6 +184,9 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
         vectorizer_kwds=None,
         normalize=True,
         dedupe_sentences=True,
+        n_jobs=1,
+        batch_size=1000,
+        memory=None,
     ):
         self.tokenizer = tokenizer
         self.tokenizer_kwds = tokenizer_kwds
@@ -149,6 +197,9 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
         # Switches
         self.return_normalized = normalize
         self.dedupe_sentences = dedupe_sentences
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
+        self.memory = memory
 
     def fit(self, X, y=None, **fit_params):
         """
@@ -165,14 +216,25 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
             ------
             self
         """
+        # Stages are fit through fit_transform_one so that they can be cached by memory.
+        memory = check_memory(self.memory)
+        fit_transform_one = memory.cache(_fit_transform_one)
+
         # TOKENIZATION
         # use tokenizer to build list of the sentences in the corpus
         # Word vectorizers are document agnostic.
+        # Only the built in tokenizers take n_jobs and batch_size; explicit tokenizer_kwds win.
+        if isinstance(self.tokenizer, str) and self.tokenizer in _SENTENCE_TOKENIZERS:
+            self.tokenizer_kwds_ = initialize_kwds(
+                {"n_jobs": self.n_jobs, "batch_size": self.batch_size}, self.tokenizer_kwds
+            )
+        else:
+            self.tokenizer_kwds_ = self.tokenizer_kwds
         self.tokenizer_ = create_processing_pipeline_stage(
-            self.tokenizer, _SENTENCE_TOKENIZERS, self.tokenizer_kwds, "tokenizer"
+            self.tokenizer, _SENTENCE_TOKENIZERS, self.tokenizer_kwds_, "tokenizer"
         )
         if self.tokenizer_ is not None:
-            tokens_by_sentence = self.tokenizer_.fit_transform(X)
+            tokens_by_sentence, self.tokenizer_ = fit_transform_one(self.tokenizer_, X)
         else:
             tokens_by_sentence = X
 
@@ -186,15 +248,15 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
             "contractor",
         )
         if self.token_contractor_ is not None:
-            tokens_by_sentence = self.token_contractor_.fit_transform(
-                tokens_by_sentence
+            tokens_by_sentence, self.token_contractor_ = fit_transform_one(
+                self.token_contractor_, tokens_by_sentence
             )
 
         # DEDUPE
         # Remove duplicate sentences.  Repeated sentences (such as signature blocks) often
         # don't provide any extra linguistic information about word usage.
         if self.dedupe_sentences:
-            tokens_by_sentence = tuple(set(tokens_by_sentence))
+            tokens_by_sentence = _dedupe_sequences(tokens_by_sentence)
 
         # VECTORIZE
         # Convert from a sequence of sequences of tokens to a sequence of fixed width numeric
@@ -206,15 +268,19 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
             "MultiTokenCooccurrenceVectorizer",
         )
         if self.vectorizer_ is not None:
-            self.representation_ = self.vectorizer_.fit_transform(tokens_by_sentence)
+            self.representation_, self.vectorizer_ = fit_transform_one(
+                self.vectorizer_, tokens_by_sentence
+            )
+            self.representation_ = _downcast_csr(self.representation_)
         else:
             # This should only be the case where all the tokenizers are also set to None
             # and the user passed in a csr matrix.
             self.representation_ = tokens_by_sentence
 
         # NORMALIZE
+        # The vectorizer keeps a reference to the matrix it returned, so normalize a copy.
         if self.return_normalized:
-            self.representation_ = normalize(self.representation_, norm="l1", axis=1)
+            self.representation_ = _l1_normalize_rows(self.representation_)
 
         # For ease of finding we promote the token dictionary to be a full class property.
         self.token_label_dictionary_ = self.vectorizer_.token_label_dictionary_
@@ -223,6 +289,10 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
         self.column_index_dictionary_ = self.vectorizer_.column_index_dictionary_
         self.vocabulary_ = self.vectorizer_.vocabulary_
 
+        # The sorted token index used by lookup_words is built on its first call.
+        self._sorted_tokens = None
+        self._sorted_token_indices = None
+
         return self
 
     def fit_transform(self, X, y=None, **fit_params):
@@ -259,22 +329,47 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
         is also present in the model.
         The sparse matrix is the representations of those words
         """
-        vocabulary_present = [w for w in words if w in self.vocabulary_]
-        indices = [self.token_label_dictionary_[word] for word in vocabulary_present]
-        return (vocabulary_present, self.representation_[indices, :])
+        words = list(words)
+        if len(words) == 0 or len(self.token_label_dictionary_) == 0:
+            return ([], self.representation_[[], :])
+        try:
+            if self._sorted_tokens is None:
+                self._build_token_index()
+            # Object arrays hold references rather than fixed width copies of every string.
+            query = np.fromiter(words, dtype=object, count=len(words))
+            positions = np.searchsorted(self._sorted_tokens, query)
+            np.clip(positions, 0, self._sorted_tokens.shape[0] - 1, out=positions)
+            present = (self._sorted_tokens[positions] == query).astype(bool)
+        except TypeError:
+            # Words (or tokens) that do not order against each other; look them up one by one.
+            vocabulary_present = [w for w in words if w in self.vocabulary_]
+            indices = [self.token_label_dictionary_[word] for word in vocabulary_present]
+            return (vocabulary_present, self.representation_[indices, :])
+        indices = self._sorted_token_indices[positions[present]]
+        return (query[present].tolist(), self.representation_[indices, :])
+
+    def _build_token_index(self):
+        n_tokens = len(self.token_label_dictionary_)
+        tokens = np.fromiter(
+            self.token_label_dictionary_.keys(), dtype=object, count=n_tokens
+        )
+        order = np.argsort(tokens)
+        self._sorted_token_indices = np.fromiter(
+            self.token_label_dictionary_.values(), dtype=np.int64, count=n_tokens
+        )[order]
+        self._sorted_tokens = tokens[order]
 
     def to_DataFrame(self, max_entries=10000, words=None):
         """
-        Converts the sparse matrix representation to a dense pandas DataFrame with
+        Converts the sparse matrix representation to a sparse pandas DataFrame with
         one row per token and one column per token co-occurence.  This is either a
         vocabulary x vocabulary DataFrame or a vocabulary x 2*vocabulary DataFrame.
         Parameters
         ----------
-        max_entries=int (10000): The maximum number of entries in a dense version of your reprsentation
-            This will error if you attempt to cast to large a sparse matrix to a DataFrame
+        max_entries=int (10000): The number of entries (including zeros) above which a warning is raised
+            The DataFrame is stored sparsely, but densifying it later can consume large amounts of memory.
         words=iterable (None): An iterable of words to return.
             Useful for looking at a small subset of your rows.
-        WARNING: this is expensive for large amounts of data since it requires the storing of zeros.
         Returns
         -------
         pandas.DataFrame
@@ -284,14 +379,13 @@ class WordVectorizer(BaseEstimator, TransformerMixin):
         vocab, submatrix = self.lookup_words(words)
         matrix_size = submatrix.shape[0] * submatrix.shape[1]
         if matrix_size > max_entries:
-            return ValueError(
+            warn(
                 f"Matrix size {matrix_size} > max_entries {max_entries}.  "
-                f"Casting a sparse matrix to dense can consume large amounts of memory.  "
-                f"Increase max_entries parameter in to_DataFrame() if you have enough ram "
-                f"for this task. "
+                f"The DataFrame is stored sparsely, but converting it to dense can consume "
+                f"large amounts of memory."
             )
-        return pd.DataFrame(
-            submatrix.todense(),
+        return pd.DataFrame.sparse.from_spmatrix(
+            submatrix.tocsr(),
             columns=[
                 self.column_label_dictionary_[x]
                 for x in range(len(self.column_label_dictionary_))
@@ -315,6 +409,10 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
         remove_effects_transformer_kwds=None,
         normalize=True,
         fit_unique=False,
+        n_jobs=1,
+        batch_size=1000,
+        memory=None,
+        chunk_size=50000,
     ):
         """
         A class for converting documents into a fixed width representation.  Useful for
@@ -345,6 +443,8 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             fixed width representation through counting the occurence of n-grams.
             In the default case this simply counts the number of occurrences of each token.
             This class returns a documents by n-gram sparse matrix of counts.
+            The string 'bow_hash' uses scikit-learn's HashingVectorizer instead, which counts
+            tokens in a single pass without building a vocabulary (so vocabulary_ will be None).
 
         info_weight_transformer = textmap.transformers.InformationWeightTransformer (default InformationWeightTransformer())
             Takes an instance of a class which re-weights the counts in a sparse matrix.
@@ -357,6 +457,27 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             Takes an instance of a class which builds a low rank model for how often we'd expect a completely random word to occur your text
             and correct for this effect.
             If this is set to None this step is skipped in the pipeline.
+
+        fit_unique = bool (default False)
+            Fit the model on the unique documents only.  Duplicate documents are given copies of
+            the representation learned for their first occurrence.
+
+        n_jobs = int (default 1)
+            The number of processes used by a built in tokenizer; -1 uses all available cores.
+
+        batch_size = int (default 1000)
+            The number of documents handed to each tokenizer process at a time.
+
+        memory = None, str or joblib.Memory (default None)
+            Used to cache each fitted stage of the pipeline, which saves refitting the early
+            stages when only later ones change (e.g. during a parameter search).  If a string is
+            given it is the path to the caching directory.  By default no caching is performed.
+
+        chunk_size = int or None (default 50000)
+            The number of documents transform tokenizes and vectorizes at a time before stacking
+            the counts, which caps the memory held by intermediate tokens.  fit always sees the
+            whole corpus since the contractor and vectorizer learn corpus wide statistics.
+            If None the documents are transformed in a single pass.
         """
         self.tokenizer = tokenizer
         self.tokenizer_kwds = tokenizer_kwds
@@ -371,6 +492,10 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
         # Switches
         self.normalize = normalize
         self.fit_unique = fit_unique
+        self.n_jobs = n_jobs
+        self.batch_size = batch_size
+        self.memory = memory
+        self.chunk_size = chunk_size
 
     def fit(self, X, y=None, **fit_params):
         """
@@ -385,14 +510,25 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
         -------
         self
         """
+        # Stages are fit through fit_transform_one so that they can be cached by memory.
+        memory = check_memory(self.memory)
+        fit_transform_one = memory.cache(_fit_transform_one)
+
         # TOKENIZATION
         # use tokenizer to build list of the sentences in the corpus
         # Word vectorizers are document agnostic.
+        # Only the built in tokenizers take n_jobs and batch_size; explicit tokenizer_kwds win.
+        if isinstance(self.tokenizer, str) and self.tokenizer in _DOCUMENT_TOKENIZERS:
+            self.tokenizer_kwds_ = initialize_kwds(
+                {"n_jobs": self.n_jobs, "batch_size": self.batch_size}, self.tokenizer_kwds
+            )
+        else:
+            self.tokenizer_kwds_ = self.tokenizer_kwds
         self.tokenizer_ = create_processing_pipeline_stage(
-            self.tokenizer, _DOCUMENT_TOKENIZERS, self.tokenizer_kwds, "tokenizer"
+            self.tokenizer, _DOCUMENT_TOKENIZERS, self.tokenizer_kwds_, "tokenizer"
         )
         if self.tokenizer_ is not None:
-            tokens_by_document = self.tokenizer_.fit_transform(X)
+            tokens_by_document, self.tokenizer_ = fit_transform_one(self.tokenizer_, X)
         else:
             tokens_by_document = X
 
@@ -404,12 +540,17 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             "contractor",
         )
         if self.token_contractor_ is not None:
-            tokens_by_document = self.token_contractor_.fit_transform(
-                tokens_by_document
+            tokens_by_document, self.token_contractor_ = fit_transform_one(
+                self.token_contractor_, tokens_by_document
             )
 
         # DEDUPE
-        # TODO: the index trick I used in UMAP unique=True
+        # Fit on the unique documents and expand back out to the full corpus at the end
+        # (the index trick used in UMAP unique=True).
+        if self.fit_unique:
+            tokens_by_document, unique_inverse = _dedupe_sequences(
+                tokens_by_document, return_inverse=True
+            )
 
         # VECTORIZE
         self.vectorizer_ = create_processing_pipeline_stage(
@@ -418,7 +559,11 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             self.vectorizer_kwds,
             "DocumentVectorizer",
         )
-        self.representation_ = self.vectorizer_.fit_transform(tokens_by_document)
+        self.representation_, self.vectorizer_ = fit_transform_one(
+            self.vectorizer_, tokens_by_document
+        )
+        # Counts are far below 2**24 and the matrix far below 2**31 entries, so 32 bits suffice.
+        self.representation_ = _downcast_csr(self.representation_)
 
         # INFO WEIGHT TRANSFORMER
         self.info_weight_transformer_ = create_processing_pipeline_stage(
@@ -428,8 +573,8 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             "InformationWeightTransformer",
         )
         if self.info_weight_transformer_:
-            self.representation_ = self.info_weight_transformer_.fit_transform(
-                self.representation_
+            self.representation_, self.info_weight_transformer_ = fit_transform_one(
+                self.info_weight_transformer_, self.representation_
             )
 
         # REMOVE EFFECTS TRANSFORMER
@@ -440,18 +585,36 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
             "RemoveEffectsTransformer",
         )
         if self.remove_effects_transformer_:
-            self.representation_ = self.remove_effects_transformer_.fit_transform(
-                self.representation_
+            self.representation_, self.remove_effects_transformer_ = fit_transform_one(
+                self.remove_effects_transformer_, self.representation_
             )
 
         # NORMALIZE
+        # The weighting stages return fresh matrices, but the vectorizer keeps a reference to
+        # the one it returned; only normalize in place when we own the matrix.
         if self.normalize:
-            self.representation_ = normalize(self.representation_, norm="l1", axis=1)
+            self.representation_ = _l1_normalize_rows(
+                self.representation_,
+                copy=not (
+                    self.info_weight_transformer_ or self.remove_effects_transformer_
+                ),
+            )
+
+        if self.fit_unique:
+            self.representation_ = self.representation_[unique_inverse]
 
         # For ease of finding we promote the token dictionary to be a full class property.
-        self.column_label_dictionary_ = self.vectorizer_.column_label_dictionary_
-        self.column_index_dictionary_ = self.vectorizer_.column_index_dictionary_
-        self.vocabulary_ = list(self.vectorizer_.column_label_dictionary_.keys())
+        # Hashing vectorizers keep no vocabulary, so they have no dictionaries to promote.
+        self.column_label_dictionary_ = getattr(
+            self.vectorizer_, "column_label_dictionary_", None
+        )
+        self.column_index_dictionary_ = getattr(
+            self.vectorizer_, "column_index_dictionary_", None
+        )
+        if self.column_label_dictionary_ is not None:
+            self.vocabulary_ = list(self.column_label_dictionary_.keys())
+        else:
+            self.vocabulary_ = None
 
         return self
 
@@ -489,34 +652,54 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
 
         """
         check_is_fitted(self, ["vectorizer_"])
-        if self.tokenizer_ is not None:
-            tokens_by_doc = self.tokenizer_.fit_transform(X)
+        # Bind the fitted stages once; transform is called repeatedly when serving.
+        info_weight_transformer = self.info_weight_transformer_
+        remove_effects_transformer = self.remove_effects_transformer_
+        chunk_size = self.chunk_size
+        vectorize_chunk = self._vectorize_chunk
+
+        # Tokens are only held for one chunk of documents at a time.  The weighting stages
+        # draw on statistics of the whole matrix so they run once, after stacking.
+        # Any iterable of documents is accepted, so chunks are taken with islice.
+        if chunk_size is None or (hasattr(X, "__len__") and len(X) <= chunk_size):
+            representation = vectorize_chunk(X)
         else:
-            tokens_by_doc = X
-        if self.token_contractor_ is not None:
-            tokens_by_doc = self.token_contractor_.transform(tokens_by_doc)
-        representation = self.vectorizer_.transform(tokens_by_doc)
-        if self.info_weight_transformer_ is not None:
-            representation = self.info_weight_transformer_.transform(representation)
-        if self.remove_effects_transformer_ is not None:
-            representation = self.remove_effects_transformer_.transform(representation)
+            documents = iter(X)
+            chunks = iter(lambda: list(islice(documents, chunk_size)), [])
+            representation = _vstack_csr(
+                [vectorize_chunk(chunk) for chunk in chunks] or [vectorize_chunk([])]
+            )
+        if info_weight_transformer is not None:
+            representation = info_weight_transformer.transform(representation)
+        if remove_effects_transformer is not None:
+            representation = remove_effects_transformer.transform(representation)
+        # Every stage returned a new matrix here, so it is safe to normalize in place.
         if self.normalize:
-            representation = normalize(representation, norm="l1", axis=1)
+            representation = _l1_normalize_rows(representation, copy=False)
         return representation
 
+    def _vectorize_chunk(self, X):
+        tokenizer = self.tokenizer_
+        token_contractor = self.token_contractor_
+        if tokenizer is not None:
+            tokens_by_doc = tokenizer.transform(X)
+        else:
+            tokens_by_doc = X
+        if token_contractor is not None:
+            tokens_by_doc = token_contractor.transform(tokens_by_doc)
+        return _downcast_csr(self.vectorizer_.transform(tokens_by_doc))
+
     def to_DataFrame(self, max_entries=10000, documents=None):
         """
-        Converts the sparse matrix representation to a dense pandas DataFrame with
-        one row per token and one column per token co-occurence.  This is either a
-        vocabulary x vocabulary DataFrame or a vocabulary x 2*vocabulary DataFrame.
+        Converts the sparse matrix representation to a sparse pandas DataFrame with
+        one row per document and one column per token (or n-gram).
         Parameters
         ----------
-        max_entries: int (default=10000): The maximum number of entries in a dense version of your reprsentation
-            This will error if you attempt to cast to large a sparse matrix to a DataFrame
+        max_entries: int (default=10000): The number of entries (including zeros) above which a warning is raised
+            The DataFrame is stored sparsely, but densifying it later can consume large amounts of memory.
         documents: list (optional, default=None)
             An iterable of document indices to return.
             Useful for looking at a small subset of your documents.
-        WARNING: this is expensive for large amounts of data since it requires the storing of zeros.
         Returns
         -------
         pandas.DataFrame
@@ -526,18 +709,19 @@ class DocVectorizer(BaseEstimator, TransformerMixin):
         submatrix = self.representation_[documents, :]
         matrix_size = submatrix.shape[0] * submatrix.shape[1]
         if matrix_size > max_entries:
-            return ValueError(
+            warn(
                 f"Matrix size {matrix_size} > max_entries {max_entries}.  "
-                f"Casting a sparse matrix to dense can consume large amounts of memory.  "
-                f"Increase max_entries parameter in to_DataFrame() if you have enough ram "
-                f"for this task. "
+                f"The DataFrame is stored sparsely, but converting it to dense can consume "
+                f"large amounts of memory."
             )
-        return pd.DataFrame(
-            submatrix.todense(),
-            columns=[
+        if self.column_index_dictionary_ is not None:
+            columns = [
                 self.column_index_dictionary_[x] for x in np.arange(submatrix.shape[1])
-            ],
-            index=documents,
+            ]
+        else:
+            columns = np.arange(submatrix.shape[1])
+        return pd.DataFrame.sparse.from_spmatrix(
+            submatrix.tocsr(), columns=columns, index=documents
         )
 
 
@@ -758,10 +942,9 @@ class JointWordDocVectorizer(BaseEstimator, TransformerMixin):
             tokens_by_sentence = self.token_contractor_.fit_transform(
                 tokens_by_sentence
             )
-            tokens_by_sentence_by_document = [
-                self.token_contractor_.transform(doc)
-                for doc in tokens_by_sentence_by_document
-            ]
+            tokens_by_sentence_by_document = _transform_sentences_by_document(
+                self.token_contractor_, tokens_by_sentence_by_document
+            )
         tokens_by_document = [flatten(doc) for doc in tokens_by_sentence_by_document]
 
         # tokens_by_sentence_by_document should be a document by sentence by tokens nested sequence.
@@ -884,14 +1067,13 @@ class JointWordDocVectorizer(BaseEstimator, TransformerMixin):
     def transform(self, X):
         check_is_fitted(self, ["doc_vectorizer_"])
         if self.tokenizer_ is not None:
-            tokens_by_sentence_by_document = self.tokenizer_.fit_transform(X)
+            tokens_by_sentence_by_document = self.tokenizer_.transform(X)
         else:
             tokens_by_sentence_by_document = X
         if self.token_contractor_ is not None:
-            tokens_by_sentence_by_document = [
-                self.token_contractor_.transform(doc)
-                for doc in tokens_by_sentence_by_document
-            ]
+            tokens_by_sentence_by_document = _transform_sentences_by_document(
+                self.token_contractor_, tokens_by_sentence_by_document
+            )
         tokens_by_sentence = flatten(tokens_by_sentence_by_document)
         tokens_by_document = tuple(
             [flatten(doc) for doc in tokens_by_sentence_by_document]
@@ -942,14 +1124,13 @@ class JointWordDocVectorizer(BaseEstimator, TransformerMixin):
         """
         check_is_fitted(self, ["doc_vectorizer_"])
         if self.tokenizer_ is not None:
-            tokens_by_sentence_by_document = self.tokenizer_.fit_transform(X)
+            tokens_by_sentence_by_document = self.tokenizer_.transform(X)
         else:
             tokens_by_sentence_by_document = X
         if self.token_contractor_ is not None:
-            tokens_by_sentence_by_document = [
-                self.token_contractor_.transform(doc)
-                for doc in tokens_by_sentence_by_document
-            ]
+            tokens_by_sentence_by_document = _transform_sentences_by_document(
+                self.token_contractor_, tokens_by_sentence_by_document
+            )
         tokens_by_document = tuple(
             [flatten(doc) for doc in tokens_by_sentence_by_document]
         )